@@ -0,0 +1,45 @@
+"""
+Shared pytest fixtures for the vectorize_iris test suite
+"""
+
+import os
+import pytest
+from unittest.mock import patch, mock_open
+
+# Built once at import; every mock_file use re-applies the patch but
+# skips rebuilding the mock_open machinery.
+_MOCK_OPEN = mock_open(read_data=b'test file content')
+
+
+@pytest.fixture(autouse=True)
+def _reset_cred_cache():
+    """Drop credentials cached from another test's environment"""
+    from vectorize_iris import _utils
+    _utils._env_creds.cache_clear()
+    yield
+
+
+@pytest.fixture(scope='module')
+def mock_env():
+    """
+    Set up mock environment variables.
+
+    Module-scoped: the env-var patch doesn't conflict across tests, so
+    one patch serves the whole module instead of being re-applied per
+    test. Tests that need the variables absent clear os.environ
+    themselves.
+    """
+    with patch.dict(os.environ, {
+        'VECTORIZE_TOKEN': 'test-token',
+        'VECTORIZE_ORG_ID': 'test-org-id'
+    }):
+        yield
+
+
+@pytest.fixture
+def mock_file():
+    """Mock file operations (function-scoped: Path.stat is mutable)"""
+    with patch('pathlib.Path.stat') as mock_stat, \
+         patch('builtins.open', _MOCK_OPEN):
+        mock_stat.return_value.st_size = 100
+        yield
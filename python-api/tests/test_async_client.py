@@ -2,33 +2,61 @@
 Unit tests for async client
 """
 
+import asyncio
+import gc
+import json
 import os
+import aiohttp
 import pytest
-from unittest.mock import Mock, patch, mock_open, AsyncMock
-from pathlib import Path
-import asyncio
+from unittest.mock import Mock, patch, AsyncMock
+
+from vectorize_iris import (
+    extract_text_async,
+    extract_text_from_file_async,
+    VectorizeIrisError,
+)
+
 
-from vectorize_iris import extract_text_async, VectorizeIrisError
+def _resp(status, json_data=None, text='', headers=None):
+    """Build a mock aiohttp response usable as an async context manager"""
+    body = json.dumps(json_data).encode() if json_data is not None else b''
+    response = AsyncMock()
+    response.status = status
+    response.json = AsyncMock(return_value=json_data)
+    response.read = AsyncMock(return_value=body)
+    response.text = AsyncMock(return_value=text or body.decode())
+    response.headers = headers or {}
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+    return response
 
 
-@pytest.fixture
-def mock_env():
-    """Set up mock environment variables"""
-    with patch.dict(os.environ, {
-        'VECTORIZE_TOKEN': 'test-token',
-        'VECTORIZE_ORG_ID': 'test-org-id'
-    }):
-        yield
+def _session(post=None, put=None, get=None):
+    """Build a mock aiohttp.ClientSession from per-method responses"""
+    # spec pins the attribute surface so typos fail loudly and AsyncMock
+    # doesn't grow an unbounded tree of auto-created child mocks.
+    session = AsyncMock(spec=aiohttp.ClientSession)
+    session.post = Mock(side_effect=post or [])
+    session.put = Mock(return_value=put or _resp(200))
+    session.get = Mock(side_effect=get or [])
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    return session
 
 
-@pytest.fixture
-def mock_file():
-    """Mock file operations"""
-    with patch('pathlib.Path.exists', return_value=True), \
-         patch('pathlib.Path.stat') as mock_stat, \
-         patch('builtins.open', mock_open(read_data=b'test file content')):
-        mock_stat.return_value.st_size = 100
-        yield
+_UPLOAD_STARTED = {'fileId': 'file-123', 'uploadUrl': 'https://upload.example.com'}
+_EXTRACTION_STARTED = {'message': 'ok', 'extractionId': 'extraction-123'}
+
+
+@pytest.fixture(autouse=True)
+def _collect_mock_cycles():
+    """Break AsyncMock reference cycles eagerly after each test"""
+    yield
+    # Drop any mock cached as the shared session singleton
+    from vectorize_iris import async_client
+    async_client._session = None
+    async_client._session_loop = None
+    gc.collect(0)
 
 
 class TestExtractTextAsync:
@@ -37,127 +65,306 @@ class TestExtractTextAsync:
     @pytest.mark.asyncio
     async def test_missing_credentials(self):
         """Test that missing credentials raises an error"""
-        with pytest.raises(VectorizeIrisError, match="Missing credentials"):
-            await extract_text_async("test.pdf")
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(VectorizeIrisError, match="Missing credentials"):
+                await extract_text_async(b'test file content')
 
     @pytest.mark.asyncio
     async def test_file_not_found(self, mock_env):
         """Test that non-existent file raises FileNotFoundError"""
         with pytest.raises(FileNotFoundError, match="File not found"):
-            await extract_text_async("/nonexistent/file.pdf")
+            await extract_text_from_file_async("/nonexistent/file.pdf")
 
     @pytest.mark.asyncio
-    async def test_successful_extraction(self, mock_env, mock_file):
+    async def test_successful_extraction(self, mock_env):
         """Test successful text extraction flow"""
-        # Mock aiohttp responses
-        mock_session = AsyncMock()
-
-        # Mock upload start
-        mock_upload_response = AsyncMock()
-        mock_upload_response.status = 200
-        mock_upload_response.json = AsyncMock(return_value={
-            'fileId': 'file-123',
-            'uploadUrl': 'https://upload.example.com'
-        })
-        mock_upload_response.__aenter__ = AsyncMock(return_value=mock_upload_response)
-        mock_upload_response.__aexit__ = AsyncMock(return_value=None)
-
-        # Mock file upload
-        mock_put_response = AsyncMock()
-        mock_put_response.status = 200
-        mock_put_response.__aenter__ = AsyncMock(return_value=mock_put_response)
-        mock_put_response.__aexit__ = AsyncMock(return_value=None)
-
-        # Mock extraction start
-        mock_extraction_response = AsyncMock()
-        mock_extraction_response.status = 200
-        mock_extraction_response.json = AsyncMock(return_value={
-            'extractionId': 'extraction-123'
-        })
-        mock_extraction_response.__aenter__ = AsyncMock(return_value=mock_extraction_response)
-        mock_extraction_response.__aexit__ = AsyncMock(return_value=None)
-
-        # Mock status checks
-        mock_status_response_1 = AsyncMock()
-        mock_status_response_1.status = 200
-        mock_status_response_1.json = AsyncMock(return_value={'status': 'processing'})
-        mock_status_response_1.__aenter__ = AsyncMock(return_value=mock_status_response_1)
-        mock_status_response_1.__aexit__ = AsyncMock(return_value=None)
-
-        mock_status_response_2 = AsyncMock()
-        mock_status_response_2.status = 200
-        mock_status_response_2.json = AsyncMock(return_value={
-            'status': 'completed',
-            'result': {'text': 'Extracted text content'}
-        })
-        mock_status_response_2.__aenter__ = AsyncMock(return_value=mock_status_response_2)
-        mock_status_response_2.__aexit__ = AsyncMock(return_value=None)
-
-        # Set up session mock
-        mock_session.post = Mock(side_effect=[
-            mock_upload_response,
-            mock_extraction_response
-        ])
-        mock_session.put = Mock(return_value=mock_put_response)
-        mock_session.get = Mock(side_effect=[
-            mock_status_response_1,
-            mock_status_response_2
-        ])
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session = _session(
+            post=[
+                _resp(200, _UPLOAD_STARTED),
+                _resp(200, _EXTRACTION_STARTED),
+            ],
+            get=[
+                _resp(200, {'ready': False}),
+                _resp(200, {
+                    'ready': True,
+                    'data': {'success': True, 'text': 'Extracted text content'}
+                }),
+            ]
+        )
+
+        with patch('vectorize_iris.async_client.aiohttp.ClientSession', return_value=mock_session):
+            result = await extract_text_async(b'test file content', poll_interval=0.01)
+
+        assert result.text == 'Extracted text content'
+        assert mock_session.post.call_count == 2  # upload start + extraction start
+        assert mock_session.put.call_count == 1   # file upload
+        assert mock_session.get.call_count == 2   # status checks
+
+    @pytest.mark.asyncio
+    async def test_successful_extraction_from_file(self, mock_env, mock_file):
+        """Test async extraction from a file path streams the open handle"""
+        mock_session = _session(
+            post=[
+                _resp(200, _UPLOAD_STARTED),
+                _resp(200, _EXTRACTION_STARTED),
+            ],
+            get=[
+                _resp(200, {
+                    'ready': True,
+                    'data': {'success': True, 'text': 'Extracted text content'}
+                }),
+            ]
+        )
+
+        with patch('vectorize_iris.async_client.aiohttp.ClientSession', return_value=mock_session):
+            result = await extract_text_from_file_async("test.pdf", poll_interval=0.01)
+
+        assert result.text == 'Extracted text content'
+        # The PUT body is the open file handle, not a bytes copy
+        upload_body = mock_session.put.call_args[1]['data']
+        assert hasattr(upload_body, 'read')
+
+    @pytest.mark.asyncio
+    async def test_long_poll_when_advertised(self, mock_env):
+        """Test that status GETs use wait= when the backend advertises long poll"""
+        mock_session = _session(
+            post=[
+                _resp(200, _UPLOAD_STARTED),
+                _resp(200, _EXTRACTION_STARTED,
+                      headers={'X-Supports-Long-Poll': 'true'}),
+            ],
+            get=[
+                _resp(200, {'ready': False}),
+                _resp(200, {
+                    'ready': True,
+                    'data': {'success': True, 'text': 'Extracted text content'}
+                }),
+            ]
+        )
 
         with patch('vectorize_iris.async_client.aiohttp.ClientSession', return_value=mock_session):
-            result = await extract_text_async("test.pdf", poll_interval=0.1)
+            result = await extract_text_async(b'test file content', poll_interval=0.01)
+
+        assert result.text == 'Extracted text content'
+        for call in mock_session.get.call_args_list:
+            assert call[1]['params'] == {'wait': '30'}
+
+    @pytest.mark.asyncio
+    async def test_long_poll_backs_off_on_instant_not_ready(self, mock_env):
+        """Test that a long-poll GET answered instantly still backs off"""
+        mock_session = _session(
+            post=[
+                _resp(200, _UPLOAD_STARTED),
+                _resp(200, _EXTRACTION_STARTED,
+                      headers={'X-Supports-Long-Poll': 'true'}),
+            ],
+            get=[
+                _resp(200, {'ready': False}),
+                _resp(200, {
+                    'ready': True,
+                    'data': {'success': True, 'text': 'Extracted text content'}
+                }),
+            ]
+        )
 
-        assert result == 'Extracted text content'
+        with patch('vectorize_iris.async_client.aiohttp.ClientSession', return_value=mock_session), \
+             patch('vectorize_iris.async_client.next_delay', return_value=0) as delay:
+            result = await extract_text_async(b'test file content', poll_interval=0.01)
+
+        assert result.text == 'Extracted text content'
+        # The mock GET returned not-ready immediately, far below the
+        # minimum server-side hold, so the loop must take the backoff
+        # path instead of re-issuing in a tight loop.
+        delay.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_extraction_failure(self, mock_env, mock_file):
+    async def test_extraction_failure(self, mock_env):
         """Test handling of extraction failure"""
-        mock_session = AsyncMock()
-
-        # Mock successful upload
-        mock_upload_response = AsyncMock()
-        mock_upload_response.status = 200
-        mock_upload_response.json = AsyncMock(return_value={
-            'fileId': 'file-123',
-            'uploadUrl': 'https://upload.example.com'
-        })
-        mock_upload_response.__aenter__ = AsyncMock(return_value=mock_upload_response)
-        mock_upload_response.__aexit__ = AsyncMock(return_value=None)
-
-        mock_put_response = AsyncMock()
-        mock_put_response.status = 200
-        mock_put_response.__aenter__ = AsyncMock(return_value=mock_put_response)
-        mock_put_response.__aexit__ = AsyncMock(return_value=None)
-
-        mock_extraction_response = AsyncMock()
-        mock_extraction_response.status = 200
-        mock_extraction_response.json = AsyncMock(return_value={
-            'extractionId': 'extraction-123'
-        })
-        mock_extraction_response.__aenter__ = AsyncMock(return_value=mock_extraction_response)
-        mock_extraction_response.__aexit__ = AsyncMock(return_value=None)
-
-        # Mock failed extraction
-        mock_status_response = AsyncMock()
-        mock_status_response.status = 200
-        mock_status_response.json = AsyncMock(return_value={
-            'status': 'failed',
-            'error': 'Invalid file format'
-        })
-        mock_status_response.__aenter__ = AsyncMock(return_value=mock_status_response)
-        mock_status_response.__aexit__ = AsyncMock(return_value=None)
-
-        mock_session.post = Mock(side_effect=[
-            mock_upload_response,
-            mock_extraction_response
-        ])
-        mock_session.put = Mock(return_value=mock_put_response)
-        mock_session.get = Mock(return_value=mock_status_response)
-        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session.__aexit__ = AsyncMock(return_value=None)
+        mock_session = _session(
+            post=[
+                _resp(200, _UPLOAD_STARTED),
+                _resp(200, _EXTRACTION_STARTED),
+            ],
+            get=[
+                _resp(200, {
+                    'ready': True,
+                    'data': {'success': False, 'error': 'Invalid file format'}
+                }),
+            ]
+        )
 
         with patch('vectorize_iris.async_client.aiohttp.ClientSession', return_value=mock_session):
             with pytest.raises(VectorizeIrisError, match="Extraction failed: Invalid file format"):
-                await extract_text_async("test.pdf", poll_interval=0.1)
+                await extract_text_async(b'test file content', poll_interval=0.01)
+
+    @pytest.mark.asyncio
+    async def test_upload_failure(self, mock_env):
+        """Test handling of upload failure"""
+        mock_session = _session(post=[_resp(400, text='Bad request')])
+
+        with patch('vectorize_iris.async_client.aiohttp.ClientSession', return_value=mock_session):
+            with pytest.raises(VectorizeIrisError, match="Failed to start upload"):
+                await extract_text_async(b'test file content')
+
+    @pytest.mark.asyncio
+    async def test_file_upload_failure(self, mock_env):
+        """Test handling of file upload failure"""
+        mock_session = _session(
+            post=[
+                _resp(200, _UPLOAD_STARTED),
+                _resp(200, _EXTRACTION_STARTED),
+            ],
+            put=_resp(403, text='Forbidden')
+        )
+
+        with patch('vectorize_iris.async_client.aiohttp.ClientSession', return_value=mock_session):
+            with pytest.raises(VectorizeIrisError, match="Failed to upload file"):
+                await extract_text_async(b'test file content')
+
+
+class TestExtractTextManyAsync:
+    """Test extract_text_many_async function"""
+
+    @pytest.mark.asyncio
+    async def test_many_extraction(self, mock_env):
+        """Test that a batch of byte payloads is extracted concurrently"""
+        from vectorize_iris import extract_text_many_async
+
+        def _post(url, **kwargs):
+            if url.endswith('/files'):
+                return _resp(200, _UPLOAD_STARTED)
+            return _resp(200, _EXTRACTION_STARTED)
+
+        def _get(url, **kwargs):
+            return _resp(200, {
+                'ready': True,
+                'data': {'success': True, 'text': 'Extracted text content'}
+            })
+
+        mock_session = AsyncMock(spec=aiohttp.ClientSession)
+        mock_session.post = Mock(side_effect=_post)
+        mock_session.put = Mock(side_effect=lambda *a, **kw: _resp(200))
+        mock_session.get = Mock(side_effect=_get)
+
+        with patch('vectorize_iris.async_client.aiohttp.ClientSession', return_value=mock_session):
+            results = await extract_text_many_async(
+                [(b'one', 'a.pdf'), (b'two', 'b.pdf'), (b'three', 'c.pdf')],
+                max_concurrency=2,
+                poll_interval=0.01
+            )
+
+        assert len(results) == 3
+        for result in results:
+            assert result.text == 'Extracted text content'
+
+    @pytest.mark.asyncio
+    async def test_many_isolates_failures(self, mock_env):
+        """Test that one failing upload surfaces as an exception in its slot"""
+        from vectorize_iris import extract_text_many_async
+
+        calls = {'n': 0}
+
+        def _post(url, **kwargs):
+            if url.endswith('/files'):
+                calls['n'] += 1
+                if calls['n'] == 1:
+                    return _resp(400, text='Bad request')
+                return _resp(200, _UPLOAD_STARTED)
+            return _resp(200, _EXTRACTION_STARTED)
+
+        def _get(url, **kwargs):
+            return _resp(200, {
+                'ready': True,
+                'data': {'success': True, 'text': 'Extracted text content'}
+            })
+
+        mock_session = AsyncMock(spec=aiohttp.ClientSession)
+        mock_session.post = Mock(side_effect=_post)
+        mock_session.put = Mock(side_effect=lambda *a, **kw: _resp(200))
+        mock_session.get = Mock(side_effect=_get)
+
+        with patch('vectorize_iris.async_client.aiohttp.ClientSession', return_value=mock_session):
+            results = await extract_text_many_async(
+                [(b'one', 'a.pdf'), (b'two', 'b.pdf')],
+                max_concurrency=1,
+                poll_interval=0.01
+            )
+
+        assert isinstance(results[0], VectorizeIrisError)
+        assert results[1].text == 'Extracted text content'
+
+
+class TestSharedSession:
+    """Test the vectorize_iris.session() context manager"""
+
+    @pytest.mark.asyncio
+    async def test_session_reused_across_calls(self, mock_env):
+        """Test that calls inside session() share one ClientSession"""
+        import vectorize_iris
+
+        def _responses():
+            return {
+                'post': [
+                    _resp(200, _UPLOAD_STARTED),
+                    _resp(200, _EXTRACTION_STARTED),
+                    _resp(200, _UPLOAD_STARTED),
+                    _resp(200, _EXTRACTION_STARTED),
+                ],
+                'get': [
+                    _resp(200, {
+                        'ready': True,
+                        'data': {'success': True, 'text': 'Extracted text content'}
+                    }),
+                    _resp(200, {
+                        'ready': True,
+                        'data': {'success': True, 'text': 'Extracted text content'}
+                    }),
+                ]
+            }
+
+        responses = _responses()
+        mock_session = _session(post=responses['post'], get=responses['get'])
+
+        with patch('vectorize_iris.async_client.aiohttp.ClientSession',
+                   return_value=mock_session) as session_cls, \
+             patch('vectorize_iris.async_client.aiohttp.TCPConnector', return_value=Mock()):
+            async with vectorize_iris.session():
+                await extract_text_async(b'one', poll_interval=0.01)
+                await extract_text_async(b'two', poll_interval=0.01)
+
+        # One session constructed for both extractions, closed on exit
+        assert session_cls.call_count == 1
+        mock_session.close.assert_awaited_once()
+
+    def test_singleton_rebuilt_after_loop_closes(self, mock_env):
+        """Test that a fresh asyncio.run gets a session on its own loop"""
+
+        def _fresh_session():
+            session = _session(
+                post=[
+                    _resp(200, _UPLOAD_STARTED),
+                    _resp(200, _EXTRACTION_STARTED),
+                ],
+                get=[
+                    _resp(200, {
+                        'ready': True,
+                        'data': {'success': True, 'text': 'Extracted text content'}
+                    }),
+                ]
+            )
+            # A real leftover session still reports closed=False after its
+            # loop dies; a truthy Mock here would hide the loop check.
+            session.closed = False
+            return session
+
+        with patch('vectorize_iris.async_client.aiohttp.ClientSession',
+                   side_effect=[_fresh_session(), _fresh_session()]) as session_cls, \
+             patch('vectorize_iris.async_client.aiohttp.TCPConnector', return_value=Mock()):
+            first = asyncio.run(extract_text_async(b'one', poll_interval=0.01))
+            second = asyncio.run(extract_text_async(b'two', poll_interval=0.01))
+
+        assert first.text == 'Extracted text content'
+        assert second.text == 'Extracted text content'
+        # The singleton from the first run is bound to a closed loop and
+        # must be replaced, not reused, on the second run.
+        assert session_cls.call_count == 2
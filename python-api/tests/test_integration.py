@@ -3,6 +3,7 @@ Integration tests for Vectorize Iris Python API
 These tests require real API credentials and network access
 """
 
+import functools
 import os
 import pytest
 from pathlib import Path
@@ -24,11 +25,18 @@ pytestmark = pytest.mark.skipif(
 )
 
 
+@functools.lru_cache(maxsize=1)
 def get_test_file() -> Path:
-    """Get path to test file"""
+    """Get path to test file (resolved once, not per test)"""
     return Path(__file__).parent.parent.parent / "examples" / "sample.md"
 
 
+@pytest.fixture(scope="module")
+def sample_bytes() -> bytes:
+    """Test file content, read once for the whole module"""
+    return get_test_file().read_bytes()
+
+
 class TestSyncIntegration:
     """Integration tests for sync client"""
 
@@ -41,15 +49,11 @@ class TestSyncIntegration:
         assert len(result.text) > 0
         print(f"\n✓ Extracted {len(result.text)} characters")
 
-    def test_extract_text_from_bytes(self):
+    def test_extract_text_from_bytes(self, sample_bytes):
         """Test extraction from bytes"""
-        test_file = get_test_file()
-        with open(test_file, "rb") as f:
-            file_bytes = f.read()
-
         result = extract_text(
-            file_bytes=file_bytes,
-            file_name=test_file.name
+            file_bytes=sample_bytes,
+            file_name=get_test_file().name
         )
 
         assert result.success is True
@@ -152,15 +156,11 @@ class TestAsyncIntegration:
         print(f"\n✓ Async: Extracted {len(result.text)} characters")
 
     @pytest.mark.asyncio
-    async def test_extract_text_async_from_bytes(self):
+    async def test_extract_text_async_from_bytes(self, sample_bytes):
         """Test async extraction from bytes"""
-        test_file = get_test_file()
-        with open(test_file, "rb") as f:
-            file_bytes = f.read()
-
         result = await extract_text_async(
-            file_bytes=file_bytes,
-            file_name=test_file.name
+            file_bytes=sample_bytes,
+            file_name=get_test_file().name
         )
 
         assert result.success is True
@@ -23,7 +23,8 @@ class TestMetadataExtractionStrategySchema:
         """Test that schema can be passed as a dict and is converted to JSON string"""
         schema_dict = {"invoice_number": "string", "total": "number"}
         schema = MetadataExtractionStrategySchema(id="test", schema=schema_dict)
-        assert schema.schema_ == json.dumps(schema_dict)
+        # Compare parsed: the exact string depends on the JSON backend
+        assert json.loads(schema.schema_) == schema_dict
 
     def test_schema_as_nested_dict(self):
         """Test that nested dict schemas are properly converted"""
@@ -39,8 +40,7 @@ class TestMetadataExtractionStrategySchema:
             }]
         }
         schema = MetadataExtractionStrategySchema(id="invoice-data", schema=schema_dict)
-        assert schema.schema_ == json.dumps(schema_dict)
-        # Verify it's valid JSON
+        # Verify it's valid JSON matching the input
         parsed = json.loads(schema.schema_)
         assert parsed == schema_dict
 
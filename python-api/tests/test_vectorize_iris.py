@@ -2,32 +2,37 @@
 Unit tests for vectorize_iris module
 """
 
+import json
 import os
 import pytest
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import Mock, patch
 from pathlib import Path
 import vectorize_iris
-from vectorize_iris import extract_text, VectorizeIrisError
+from vectorize_iris import extract_text, extract_text_from_file, VectorizeIrisError
 
 
-@pytest.fixture
-def mock_env():
-    """Set up mock environment variables"""
-    with patch.dict(os.environ, {
-        'VECTORIZE_TOKEN': 'test-token',
-        'VECTORIZE_ORG_ID': 'test-org-id'
-    }):
-        yield
+def _resp(status_code, json_data=None, text=''):
+    """Build a mock requests.Response with the given status and payload"""
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = json_data
+    response.content = json.dumps(json_data).encode() if json_data is not None else b''
+    response.text = text or (json.dumps(json_data) if json_data is not None else '')
+    response.headers = {}
+    return response
+
+
+_UPLOAD_STARTED = {'fileId': 'file-123', 'uploadUrl': 'https://upload.example.com'}
+_EXTRACTION_STARTED = {'message': 'ok', 'extractionId': 'extraction-123'}
 
 
 @pytest.fixture
-def mock_file():
-    """Mock file operations"""
-    with patch('pathlib.Path.exists', return_value=True), \
-         patch('pathlib.Path.stat') as mock_stat, \
-         patch('builtins.open', mock_open(read_data=b'test file content')):
-        mock_stat.return_value.st_size = 100
-        yield
+def mock_session():
+    """Replace the shared requests session with a mock"""
+    with patch('vectorize_iris.client._get_session') as get_session:
+        session = Mock()
+        get_session.return_value = session
+        yield session
 
 
 class TestExtractText:
@@ -35,153 +40,294 @@ class TestExtractText:
 
     def test_missing_credentials(self):
         """Test that missing credentials raises an error"""
-        with pytest.raises(VectorizeIrisError, match="Missing credentials"):
-            extract_text("test.pdf")
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(VectorizeIrisError, match="Missing credentials"):
+                extract_text(b'test file content')
+
+    def test_credentials_set_after_failed_call(self, mock_session):
+        """Test that a credentials miss is not cached for the process"""
+        mock_session.post.side_effect = [
+            _resp(200, _UPLOAD_STARTED),
+            _resp(200, _EXTRACTION_STARTED),
+        ]
+        mock_session.put.return_value = _resp(200)
+        mock_session.get.return_value = _resp(200, {
+            'ready': True,
+            'data': {'success': True, 'text': 'Extracted text content'}
+        })
+
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(VectorizeIrisError, match="Missing credentials"):
+                extract_text(b'test file content')
+
+        # Setting the variables after the failure must take effect
+        with patch.dict(os.environ, {
+            'VECTORIZE_TOKEN': 'late-token',
+            'VECTORIZE_ORG_ID': 'late-org-id'
+        }):
+            result = extract_text(b'test file content', poll_interval=0.01)
+
+        assert result.text == 'Extracted text content'
 
     def test_file_not_found(self, mock_env):
         """Test that non-existent file raises FileNotFoundError"""
         with pytest.raises(FileNotFoundError, match="File not found"):
-            extract_text("/nonexistent/file.pdf")
+            extract_text_from_file("/nonexistent/file.pdf")
 
-    @patch('vectorize_iris.requests.post')
-    @patch('vectorize_iris.requests.put')
-    @patch('vectorize_iris.requests.get')
-    def test_successful_extraction(self, mock_get, mock_put, mock_post, mock_env, mock_file):
+    def test_successful_extraction(self, mock_env, mock_session):
         """Test successful text extraction flow"""
-        # Mock upload start
-        mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = {
-            'fileId': 'file-123',
-            'uploadUrl': 'https://upload.example.com'
-        }
-
-        # Mock file upload
-        mock_put.return_value.status_code = 200
-
-        # Mock extraction polling - first processing, then completed
-        mock_get_response_1 = Mock()
-        mock_get_response_1.status_code = 200
-        mock_get_response_1.json.return_value = {'status': 'processing'}
-
-        mock_get_response_2 = Mock()
-        mock_get_response_2.status_code = 200
-        mock_get_response_2.json.return_value = {
-            'status': 'completed',
-            'result': {'text': 'Extracted text content'}
-        }
-
-        mock_get.side_effect = [mock_get_response_1, mock_get_response_2]
-
-        # Call extract_text with short poll interval for faster test
-        result = extract_text("test.pdf", poll_interval=0.1)
-
-        assert result == 'Extracted text content'
-        assert mock_post.call_count == 2  # upload start + extraction start
-        assert mock_put.call_count == 1   # file upload
-        assert mock_get.call_count == 2   # status checks
-
-    @patch('vectorize_iris.requests.post')
-    def test_upload_failure(self, mock_post, mock_env, mock_file):
+        mock_session.post.side_effect = [
+            _resp(200, _UPLOAD_STARTED),
+            _resp(200, _EXTRACTION_STARTED),
+        ]
+        mock_session.put.return_value = _resp(200)
+
+        # First poll still processing, second poll completed
+        mock_session.get.side_effect = [
+            _resp(200, {'ready': False}),
+            _resp(200, {
+                'ready': True,
+                'data': {'success': True, 'text': 'Extracted text content'}
+            }),
+        ]
+
+        result = extract_text(b'test file content', poll_interval=0.01)
+
+        assert result.text == 'Extracted text content'
+        assert mock_session.post.call_count == 2  # upload start + extraction start
+        assert mock_session.put.call_count == 1   # file upload
+        assert mock_session.get.call_count == 2   # status checks
+
+    def test_successful_extraction_from_file(self, mock_env, mock_file, mock_session):
+        """Test extraction from a file path streams the open file handle"""
+        mock_session.post.side_effect = [
+            _resp(200, _UPLOAD_STARTED),
+            _resp(200, _EXTRACTION_STARTED),
+        ]
+        mock_session.put.return_value = _resp(200)
+        mock_session.get.return_value = _resp(200, {
+            'ready': True,
+            'data': {'success': True, 'text': 'Extracted text content'}
+        })
+
+        result = extract_text_from_file("test.pdf", poll_interval=0.01)
+
+        assert result.text == 'Extracted text content'
+        # The PUT body is the open file handle, not a bytes copy
+        upload_body = mock_session.put.call_args[1]['data']
+        assert hasattr(upload_body, 'read')
+
+    def test_gzip_upload_for_text_files(self, mock_env, mock_file, mock_session):
+        """Test that opting into gzip compresses text-suffix uploads"""
+        import gzip
+
+        mock_session.post.side_effect = [
+            _resp(200, _UPLOAD_STARTED),
+            _resp(200, _EXTRACTION_STARTED),
+        ]
+        mock_session.put.return_value = _resp(200)
+        mock_session.get.return_value = _resp(200, {
+            'ready': True,
+            'data': {'success': True, 'text': 'Extracted text content'}
+        })
+
+        result = extract_text_from_file("notes.md", poll_interval=0.01, gzip_uploads=True)
+
+        assert result.text == 'Extracted text content'
+        put_kwargs = mock_session.put.call_args[1]
+        assert put_kwargs['headers']['Content-Encoding'] == 'gzip'
+        assert gzip.decompress(put_kwargs['data'].getvalue()) == b'test file content'
+
+    def test_upload_failure(self, mock_env):
         """Test handling of upload failure"""
-        mock_post.return_value.status_code = 400
-        mock_post.return_value.text = 'Bad request'
+        with patch('vectorize_iris.client._get_session') as get_session:
+            session = Mock()
+            get_session.return_value = session
+            session.post.return_value = _resp(400, text='Bad request')
 
-        with pytest.raises(VectorizeIrisError, match="Failed to start upload"):
-            extract_text("test.pdf")
+            with pytest.raises(VectorizeIrisError, match="Failed to start upload"):
+                extract_text(b'test file content')
 
-    @patch('vectorize_iris.requests.post')
-    @patch('vectorize_iris.requests.put')
-    def test_file_upload_failure(self, mock_put, mock_post, mock_env, mock_file):
+    def test_file_upload_failure(self, mock_env, mock_session):
         """Test handling of file upload failure"""
-        # Mock successful upload start
-        mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = {
-            'fileId': 'file-123',
-            'uploadUrl': 'https://upload.example.com'
-        }
-
-        # Mock failed file upload
-        mock_put.return_value.status_code = 403
-        mock_put.return_value.text = 'Forbidden'
+        mock_session.post.return_value = _resp(200, _UPLOAD_STARTED)
+        mock_session.put.return_value = _resp(403, text='Forbidden')
 
         with pytest.raises(VectorizeIrisError, match="Failed to upload file"):
-            extract_text("test.pdf")
+            extract_text(b'test file content')
 
-    @patch('vectorize_iris.requests.post')
-    @patch('vectorize_iris.requests.put')
-    @patch('vectorize_iris.requests.get')
-    def test_extraction_failure(self, mock_get, mock_put, mock_post, mock_env, mock_file):
+    def test_extraction_failure(self, mock_env, mock_session):
         """Test handling of extraction failure"""
-        # Mock successful upload
-        mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = {
-            'fileId': 'file-123',
-            'uploadUrl': 'https://upload.example.com'
-        }
-        mock_put.return_value.status_code = 200
-
-        # Mock failed extraction
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
-            'status': 'failed',
-            'error': 'Invalid file format'
-        }
+        mock_session.post.side_effect = [
+            _resp(200, _UPLOAD_STARTED),
+            _resp(200, _EXTRACTION_STARTED),
+        ]
+        mock_session.put.return_value = _resp(200)
+        mock_session.get.return_value = _resp(200, {
+            'ready': True,
+            'data': {'success': False, 'error': 'Invalid file format'}
+        })
 
         with pytest.raises(VectorizeIrisError, match="Extraction failed: Invalid file format"):
-            extract_text("test.pdf", poll_interval=0.1)
+            extract_text(b'test file content', poll_interval=0.01)
 
-    @patch('vectorize_iris.requests.post')
-    @patch('vectorize_iris.requests.put')
-    @patch('vectorize_iris.requests.get')
-    @patch('vectorize_iris.time.time')
-    def test_extraction_timeout(self, mock_time, mock_get, mock_put, mock_post, mock_env, mock_file):
+    @patch('vectorize_iris.client.time.time')
+    def test_extraction_timeout(self, mock_time, mock_env, mock_session):
         """Test extraction timeout"""
-        # Mock successful upload
-        mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = {
-            'fileId': 'file-123',
-            'uploadUrl': 'https://upload.example.com'
-        }
-        mock_put.return_value.status_code = 200
+        mock_session.post.side_effect = [
+            _resp(200, _UPLOAD_STARTED),
+            _resp(200, _EXTRACTION_STARTED),
+        ]
+        mock_session.put.return_value = _resp(200)
+        mock_session.get.return_value = _resp(200, {'ready': False})
 
-        # Mock always processing status
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {'status': 'processing'}
-
-        # Mock timeout
-        mock_time.side_effect = [0, 0, 400]  # Start time, first check, then timeout
+        # Start time, then a check already past the timeout
+        mock_time.side_effect = [0, 400]
 
         with pytest.raises(VectorizeIrisError, match="Extraction timed out"):
-            extract_text("test.pdf", poll_interval=0.1, timeout=300)
+            extract_text(b'test file content', poll_interval=0.01, timeout=300)
 
-    def test_custom_credentials(self, mock_file):
+    def test_custom_credentials(self, mock_session):
         """Test using custom credentials instead of env vars"""
-        with patch('vectorize_iris.requests.post') as mock_post, \
-             patch('vectorize_iris.requests.put') as mock_put, \
-             patch('vectorize_iris.requests.get') as mock_get:
-
-            # Mock successful flow
-            mock_post.return_value.status_code = 200
-            mock_post.return_value.json.return_value = {
-                'fileId': 'file-123',
-                'uploadUrl': 'https://upload.example.com'
-            }
-            mock_put.return_value.status_code = 200
-            mock_get.return_value.status_code = 200
-            mock_get.return_value.json.return_value = {
-                'status': 'completed',
-                'result': {'text': 'Success'}
-            }
-
-            result = extract_text(
-                "test.pdf",
-                api_token="custom-token",
-                org_id="custom-org",
-                poll_interval=0.1
+        mock_session.post.side_effect = [
+            _resp(200, _UPLOAD_STARTED),
+            _resp(200, _EXTRACTION_STARTED),
+        ]
+        mock_session.put.return_value = _resp(200)
+        mock_session.get.return_value = _resp(200, {
+            'ready': True,
+            'data': {'success': True, 'text': 'Success'}
+        })
+
+        result = extract_text(
+            b'test file content',
+            api_token="custom-token",
+            org_id="custom-org",
+            poll_interval=0.01
+        )
+
+        assert result.text == 'Success'
+
+        # Verify custom credentials were used
+        auth_header = mock_session.post.call_args[1]['headers']['Authorization']
+        assert auth_header == 'Bearer custom-token'
+
+
+class TestMetadataSchemaCache:
+    """Test the metadata schema serialization cache"""
+
+    def test_schema_dict_serialized_once(self):
+        """Test that a reused schema dict is dumped once and cache-hit after"""
+        from vectorize_iris.models import MetadataExtractionStrategySchema, _dumps_frozen
+
+        MetadataExtractionStrategySchema.clear_cache()
+        schema = {'type': 'object', 'properties': {'title': {'type': 'string'}}}
+
+        first = MetadataExtractionStrategySchema(id='s1', schema=schema)
+        second = MetadataExtractionStrategySchema(id='s2', schema=schema)
+
+        assert first.schema_ == second.schema_
+        assert json.loads(first.schema_) == schema
+        info = _dumps_frozen.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+
+class TestResultCache:
+    """Test the opt-in on-disk result cache"""
+
+    def test_cache_round_trip(self, mock_env, mock_session, tmp_path):
+        """Test that a result is written back and a re-run skips the network"""
+        mock_session.post.side_effect = [
+            _resp(200, _UPLOAD_STARTED),
+            _resp(200, _EXTRACTION_STARTED),
+        ]
+        mock_session.put.return_value = _resp(200)
+        mock_session.get.return_value = _resp(200, {
+            'ready': True,
+            'data': {'success': True, 'text': 'Extracted text content'}
+        })
+
+        first = extract_text(
+            b'test file content', cache_dir=str(tmp_path), poll_interval=0.01
+        )
+        assert first.text == 'Extracted text content'
+        assert list(tmp_path.glob('*.json'))
+
+        # Second identical call is served from disk without any HTTP calls
+        mock_session.reset_mock()
+        second = extract_text(b'test file content', cache_dir=str(tmp_path))
+        assert second.text == 'Extracted text content'
+        mock_session.post.assert_not_called()
+        mock_session.get.assert_not_called()
+
+    def test_cache_key_varies_with_options(self):
+        """Test that different options produce different cache keys"""
+        from vectorize_iris import _cache
+        from vectorize_iris.models import ExtractionOptions
+
+        base = _cache.cache_key(b'same bytes', None)
+        chunked = _cache.cache_key(b'same bytes', ExtractionOptions(chunk_size=512))
+        assert base != chunked
+
+
+class TestExtractTextBatch:
+    """Test extract_text_batch function"""
+
+    def test_batch_extraction(self, mock_env, mock_file):
+        """Test that a batch of files is extracted and failures are isolated"""
+        from unittest.mock import AsyncMock
+        from vectorize_iris import extract_text_batch
+
+        def _aresp(status, json_data=None):
+            body = json.dumps(json_data).encode() if json_data is not None else b''
+            response = AsyncMock()
+            response.status = status
+            response.json = AsyncMock(return_value=json_data)
+            response.read = AsyncMock(return_value=body)
+            response.headers = {}
+            response.__aenter__ = AsyncMock(return_value=response)
+            response.__aexit__ = AsyncMock(return_value=None)
+            return response
+
+        def _post(url, **kwargs):
+            if url.endswith('/files'):
+                return _aresp(200, _UPLOAD_STARTED)
+            return _aresp(200, _EXTRACTION_STARTED)
+
+        def _get(url, **kwargs):
+            return _aresp(200, {
+                'ready': True,
+                'data': {'success': True, 'text': 'Extracted text content'}
+            })
+
+        mock_session = AsyncMock()
+        mock_session.post = Mock(side_effect=_post)
+        mock_session.put = Mock(return_value=_aresp(200))
+        mock_session.get = Mock(side_effect=_get)
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(return_value=None)
+
+        progress_calls = []
+
+        with patch('vectorize_iris.async_client.aiohttp.ClientSession', return_value=mock_session):
+            results = extract_text_batch(
+                ["a.pdf", "b.pdf", "c.pdf"],
+                concurrency=2,
+                poll_interval=0.01,
+                on_progress=lambda done, total, result: progress_calls.append((done, total))
             )
 
-            assert result == 'Success'
+        assert len(results) == 3
+        for result in results:
+            assert result.text == 'Extracted text content'
+        assert progress_calls == [(1, 3), (2, 3), (3, 3)]
+
+    def test_batch_isolates_failures(self, mock_env):
+        """Test that a missing file yields an exception without failing the batch"""
+        from vectorize_iris import extract_text_batch
+
+        results = extract_text_batch(["/nonexistent/file.pdf"])
 
-            # Verify custom credentials were used
-            auth_header = mock_post.call_args[1]['headers']['Authorization']
-            assert auth_header == 'Bearer custom-token'
+        assert len(results) == 1
+        assert isinstance(results[0], FileNotFoundError)
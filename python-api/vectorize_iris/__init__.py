@@ -4,8 +4,6 @@ Extract text from files using Vectorize Iris with a single function call.
 """
 
 from vectorize_iris.exceptions import VectorizeIrisError
-from vectorize_iris.client import extract_text, extract_text_from_file
-from vectorize_iris.async_client import extract_text_async, extract_text_from_file_async
 from vectorize_iris.models import (
     ExtractionOptions,
     ExtractionResultData,
@@ -19,9 +17,14 @@ __all__ = [
     # Sync functions
     "extract_text",
     "extract_text_from_file",
+    "extract_text_batch",
+    "extract_text_parallel",
     # Async functions
     "extract_text_async",
     "extract_text_from_file_async",
+    "extract_text_many_async",
+    "session",
+    "aclose",
     # Models
     "ExtractionOptions",
     "ExtractionResultData",
@@ -30,3 +33,31 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+# The client modules pull in requests/aiohttp, which dominate import
+# time. Load them lazily (PEP 562) so `import vectorize_iris` for the
+# models alone stays cheap.
+_SYNC_FUNCTIONS = {"extract_text", "extract_text_from_file", "extract_text_batch"}
+_ASYNC_FUNCTIONS = {
+    "extract_text_async",
+    "extract_text_from_file_async",
+    "extract_text_many_async",
+    "session",
+    "aclose",
+}
+
+
+def __getattr__(name):
+    if name == "extract_text_parallel":
+        from vectorize_iris.batch import extract_text_parallel
+        globals()[name] = extract_text_parallel
+        return extract_text_parallel
+    if name in _SYNC_FUNCTIONS:
+        from vectorize_iris import client
+        globals().update({fn: getattr(client, fn) for fn in _SYNC_FUNCTIONS})
+        return globals()[name]
+    if name in _ASYNC_FUNCTIONS:
+        from vectorize_iris import async_client
+        globals().update({fn: getattr(async_client, fn) for fn in _ASYNC_FUNCTIONS})
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
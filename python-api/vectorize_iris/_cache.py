@@ -0,0 +1,50 @@
+"""
+Opt-in on-disk cache of extraction results, keyed by file content.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+from vectorize_iris.models import ExtractionOptions, ExtractionResultData
+
+
+def cache_key(file_bytes: bytes, options: Optional[ExtractionOptions]) -> str:
+    """
+    Content-addressed cache key: SHA-256 over the file bytes and the
+    options that shape the result. The length prefix keeps distinct
+    (bytes, options) pairs from ever hashing the same concatenation.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(len(file_bytes).to_bytes(8, 'big'))
+    hasher.update(file_bytes)
+    if options is not None:
+        hasher.update(options.model_dump_json(exclude_none=True).encode())
+    return hasher.hexdigest()
+
+
+def load(cache_dir: Union[str, Path], key: str) -> Optional[ExtractionResultData]:
+    """Return the cached result for key, or None on miss/corruption."""
+    path = Path(cache_dir) / f"{key}.json"
+    try:
+        return ExtractionResultData.model_validate_json(path.read_bytes())
+    except (OSError, ValueError):
+        # Missing or unreadable entries are plain misses; a corrupt one
+        # will be overwritten by the next successful extraction.
+        return None
+
+
+def store(cache_dir: Union[str, Path], key: str, result: ExtractionResultData) -> None:
+    """
+    Persist a result under key.
+
+    Written to a temp file in the same directory and moved into place
+    with os.replace, so concurrent readers never see a partial entry.
+    """
+    directory = Path(cache_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    final_path = directory / f"{key}.json"
+    tmp_path = directory / f"{key}.{os.getpid()}.tmp"
+    tmp_path.write_text(result.model_dump_json())
+    os.replace(tmp_path, final_path)
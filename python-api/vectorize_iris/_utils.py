@@ -0,0 +1,123 @@
+"""
+Internal helpers shared by the sync and async clients.
+"""
+
+import functools
+import gzip
+import io
+import os
+import random
+import shutil
+from typing import BinaryIO, Dict, Optional, Tuple
+
+# File suffixes whose content is typically compressible text; binary
+# formats like PDF are already compressed and not worth gzipping.
+TEXT_SUFFIXES = frozenset({'.md', '.txt', '.html', '.csv', '.json', '.xml', '.py', '.js'})
+
+# Minimum seconds a long-poll status GET must have been held server-side
+# before the client re-issues it without delay. A backend (or a proxy
+# stripping the wait= parameter) that answers not-ready instantly would
+# otherwise be hammered in a tight request loop; below this threshold
+# the poll loops fall back to their normal backoff.
+LONG_POLL_MIN_HOLD = 1.0
+
+
+@functools.lru_cache(maxsize=1)
+def _env_creds() -> Tuple[str, str]:
+    """Both credential variables, cached once both are set.
+
+    os.environ[...] raises on a missing variable, and lru_cache does not
+    cache calls that raise — so only complete credentials are memoized.
+    """
+    return os.environ['VECTORIZE_TOKEN'], os.environ['VECTORIZE_ORG_ID']
+
+
+def default_creds() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Environment credentials (token, org id).
+
+    Complete credentials are read once per process, so hot batch loops
+    skip the repeated os.getenv lookups — but a miss is never cached:
+    a process that starts without credentials picks them up as soon as
+    the variables are set. Missing values come back as None; the public
+    functions decide whether that is an error.
+    """
+    try:
+        return _env_creds()
+    except KeyError:
+        return os.getenv('VECTORIZE_TOKEN'), os.getenv('VECTORIZE_ORG_ID')
+
+
+@functools.lru_cache(maxsize=8)
+def build_headers(api_token: str) -> Dict[str, str]:
+    """
+    API request headers for a token, built once and shared.
+
+    Callers treat the returned dict as read-only; per-request header
+    additions must copy it first.
+    """
+    return {
+        "Authorization": f"Bearer {api_token}",
+        "Content-Type": "application/json",
+        # Both HTTP libraries negotiate compression by default, but the
+        # explicit header keeps large result fetches compressed even if
+        # a session is configured with bare default headers.
+        "Accept-Encoding": "gzip, deflate"
+    }
+
+
+def next_delay(attempt: int, base: float, cap: float = 15.0, factor: float = 1.5) -> float:
+    """
+    Capped exponential backoff with full jitter.
+
+    Returns a delay drawn uniformly from [0, min(cap, base * factor**attempt)].
+    Full jitter spreads concurrent pollers across the whole window, so a
+    batch of extractions started together never re-synchronizes into
+    thundering-herd polls.
+    """
+    return random.uniform(0.0, min(cap, base * (factor ** attempt)))
+
+
+def gzip_payload(stream: BinaryIO) -> io.BytesIO:
+    """
+    Compress a binary stream into an in-memory gzip body.
+
+    compresslevel=1 trades a few percent of ratio for much lower CPU
+    cost — for text documents the upload still shrinks several-fold.
+    """
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=1) as gz:
+        shutil.copyfileobj(stream, gz)
+    buf.seek(0)
+    return buf
+
+
+try:
+    import orjson
+
+    def json_loads(data):
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def json_dumps(obj) -> str:
+        """Serialize to a JSON string."""
+        return orjson.dumps(obj).decode()
+
+    def json_dumps_bytes(obj) -> bytes:
+        """Serialize to UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+except ImportError:  # orjson is an optional speedup
+    import json as _json
+
+    def json_loads(data):
+        """Parse JSON from bytes or str."""
+        return _json.loads(data)
+
+    def json_dumps(obj) -> str:
+        """Serialize to a JSON string."""
+        return _json.dumps(obj)
+
+    def json_dumps_bytes(obj) -> bytes:
+        """Serialize to UTF-8 JSON bytes."""
+        return _json.dumps(obj).encode()
@@ -2,59 +2,256 @@
 Asynchronous client for Vectorize Iris text extraction
 """
 
-import os
 import asyncio
 import aiohttp
-from typing import Optional
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import BinaryIO, List, Optional, Sequence, Tuple, Union
 from pathlib import Path
 
+from vectorize_iris import _cache
+from vectorize_iris._utils import (
+    LONG_POLL_MIN_HOLD,
+    TEXT_SUFFIXES,
+    build_headers,
+    default_creds,
+    gzip_payload,
+    json_dumps_bytes,
+    json_loads,
+    next_delay,
+)
 from vectorize_iris.exceptions import VectorizeIrisError
 from vectorize_iris.models import (
+    _EXTRACTION_RESPONSE_ADAPTER,
+    _RESULT_DATA_ADAPTER,
+    _UPLOAD_RESPONSE_ADAPTER,
     StartFileUploadRequest,
-    StartFileUploadResponse,
-    StartExtractionRequest,
-    StartExtractionResponse,
-    ExtractionResult,
     ExtractionResultData,
     ExtractionOptions,
 )
 
 
+_session_var: ContextVar[Optional[aiohttp.ClientSession]] = ContextVar(
+    'vectorize_iris_session', default=None
+)
+
+# Per-request timeouts: the wall-clock `timeout` parameter bounds the
+# whole job, but without these a single stalled socket could hang a poll
+# or control-plane call for the session default instead of failing fast.
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, sock_connect=3, sock_read=7)
+# Long polls are held server-side for up to ~30s by design.
+_LONG_POLL_TIMEOUT = aiohttp.ClientTimeout(total=40, sock_connect=3, sock_read=35)
+
+
+def _upload_timeout(file_size: int) -> aiohttp.ClientTimeout:
+    """Upload timeout scaled to the body: floor of 60s, ~1s per MB."""
+    return aiohttp.ClientTimeout(total=max(60, file_size // 1_000_000), sock_connect=5)
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """
+    Return the process-wide keep-alive session, creating it on first use.
+
+    Without it, every extraction outside a session() block paid a fresh
+    TCP + TLS handshake for the upload-start POST and again for each
+    poll GET. The singleton keeps warm connections to the API host (and
+    the presigned upload host) across calls; sock_connect/sock_read
+    timeouts bound each I/O step without capping total extraction time,
+    which the poll loop enforces itself.
+
+    A session is bound to the event loop it was created on, so the loop
+    is tracked alongside it: a session left over from an earlier
+    asyncio.run() would fail every request with "Event loop is closed"
+    and is replaced instead of reused.
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        if _session is not None and not _session.closed:
+            # Stale session from another (usually already-closed) loop:
+            # detach it and best-effort-close its connector so neither
+            # object warns at garbage collection.
+            stale_connector = _session.connector
+            _session.detach()
+            if stale_connector is not None:
+                try:
+                    await stale_connector.close()
+                except Exception:
+                    # Its sockets died with the old loop; nothing to free.
+                    pass
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=32,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=60)
+        )
+        _session_loop = loop
+    return _session
+
+
+async def aclose() -> None:
+    """
+    Close the shared client session (call at application shutdown).
+
+    Safe to call multiple times; the next extraction transparently
+    creates a fresh session.
+    """
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
+@asynccontextmanager
+async def session():
+    """
+    Share one aiohttp.ClientSession across async extractions.
+
+    Every extraction inside the block reuses the same connection pool,
+    DNS cache, and SSL context instead of building and tearing them down
+    per call — the main per-file overhead when batching. The session is
+    stored in a contextvar, so concurrent tasks inside the block share
+    it without changing any call signatures.
+
+    Example:
+        >>> async with vectorize_iris.session():
+        ...     results = await asyncio.gather(
+        ...         extract_text_from_file_async("a.pdf"),
+        ...         extract_text_from_file_async("b.pdf"),
+        ...     )
+    """
+    client_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+    )
+    token = _session_var.set(client_session)
+    try:
+        yield client_session
+    finally:
+        _session_var.reset(token)
+        await client_session.close()
+
+
+async def _await_ready(
+    session: aiohttp.ClientSession,
+    status_url: str,
+    headers: dict,
+    poll_interval: float,
+    timeout: int,
+    poll_max_interval: float,
+    poll_backoff: float,
+    long_poll: bool
+) -> ExtractionResultData:
+    """
+    Wait for an extraction to finish and return its data.
+
+    When the backend supports long polling, each GET is held server-side
+    until the status changes (or ~30s passes), turning N polls into one
+    awaited round-trip. Otherwise poll with exponential backoff: fast
+    jobs are noticed within the initial interval while long jobs poll
+    less and less often, up to poll_max_interval. The jitter keeps
+    concurrent extractions from polling in lockstep.
+    """
+    status_params = {'wait': '30'} if long_poll else None
+    status_timeout = _LONG_POLL_TIMEOUT if long_poll else _REQUEST_TIMEOUT
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    attempt = 0
+
+    while True:
+        if loop.time() > deadline:
+            raise VectorizeIrisError(f"Extraction timed out after {timeout} seconds")
+
+        request_started = loop.time()
+        async with session.get(
+            status_url,
+            headers=headers,
+            params=status_params,
+            timeout=status_timeout
+        ) as status_response:
+            if status_response.status != 200:
+                error_text = await status_response.text()
+                raise VectorizeIrisError(
+                    f"Failed to check status: {status_response.status} - {error_text}"
+                )
+
+            # Check readiness on the raw payload; the full result model
+            # is only validated once, on the poll that carries data.
+            payload = json_loads(await status_response.read())
+
+            if payload.get('ready'):
+                if payload.get('data') is None:
+                    raise VectorizeIrisError("Extraction completed but no data was returned")
+
+                result_data = _RESULT_DATA_ADAPTER.validate_python(payload['data'])
+
+                if not result_data.success:
+                    error_msg = result_data.error or "Unknown error"
+                    raise VectorizeIrisError(f"Extraction failed: {error_msg}")
+
+                return result_data
+
+        # Still processing; with long polling the server already held
+        # the request, so re-issue immediately — but only if it actually
+        # held it. An instant not-ready answer (wait= stripped by a
+        # proxy, load shedding) would otherwise busy-loop at full RTT,
+        # so fast responses fall through to the backoff path.
+        if long_poll and loop.time() - request_started >= LONG_POLL_MIN_HOLD:
+            continue
+        attempt += 1
+        await asyncio.sleep(next_delay(attempt, poll_interval, poll_max_interval, poll_backoff))
+
+
 async def _extract_from_bytes_async(
-    file_content: bytes,
+    file_content: Union[bytes, BinaryIO],
     file_name: str,
     api_token: str,
     org_id: str,
-    poll_interval: int,
+    poll_interval: float,
     timeout: int,
-    options: Optional[ExtractionOptions] = None
+    options: Optional[ExtractionOptions] = None,
+    file_size: Optional[int] = None,
+    poll_max_interval: float = 5.0,
+    poll_backoff: float = 1.5,
+    content_encoding: Optional[str] = None
 ) -> ExtractionResultData:
     """
-    Internal async function to extract from file bytes.
+    Internal async function to extract from file bytes or a binary stream.
+
+    When a stream is passed, file_size must be provided; aiohttp reads it
+    in 64 KiB chunks off the event loop instead of buffering the body.
     """
     base_url = f"https://api.vectorize.io/v1/org/{org_id}"
-    headers = {
-        "Authorization": f"Bearer {api_token}",
-        "Content-Type": "application/json"
-    }
+    headers = build_headers(api_token)
 
-    file_size = len(file_content)
+    if file_size is None:
+        file_size = len(file_content)
 
     # Default options if not provided
     if options is None:
         options = ExtractionOptions()
 
-    async with aiohttp.ClientSession() as session:
+    async def _run(session: aiohttp.ClientSession) -> ExtractionResultData:
         # Step 1: Start file upload and get presigned URL
         upload_request = StartFileUploadRequest(
             name=file_name,
             content_type="application/octet-stream"
         )
 
+        # The headers already declare application/json, so encode the
+        # body directly (orjson when available) instead of the json=
+        # kwarg's stdlib serializer.
         async with session.post(
             f"{base_url}/files",
             headers=headers,
-            json=upload_request.model_dump(by_alias=True)
+            data=json_dumps_bytes(upload_request.model_dump(by_alias=True)),
+            timeout=_REQUEST_TIMEOUT
         ) as upload_response:
             if upload_response.status != 200:
                 error_text = await upload_response.text()
@@ -62,72 +259,85 @@ async def _extract_from_bytes_async(
                     f"Failed to start upload: {upload_response.status} - {error_text}"
                 )
 
-            upload_data = StartFileUploadResponse(**(await upload_response.json()))
+            upload_data = _UPLOAD_RESPONSE_ADAPTER.validate_json(await upload_response.read())
 
-        # Step 2: Upload file to presigned URL
+        # Steps 2 + 3: Upload file to presigned URL and start extraction.
+        # The extraction-start POST only needs the file_id from step 1, so
+        # it is issued while the PUT is still draining; the service queues
+        # the job against the upload instead of waiting for it serially.
         upload_headers = {
             "Content-Type": "application/octet-stream",
             "Content-Length": str(file_size)
         }
-
-        async with session.put(
-            upload_data.upload_url,
-            data=file_content,
-            headers=upload_headers
-        ) as put_response:
-            if put_response.status not in (200, 201, 204):
-                error_text = await put_response.text()
-                raise VectorizeIrisError(
-                    f"Failed to upload file: {put_response.status} - {error_text}"
-                )
-
-        # Step 3: Start extraction
-        extraction_request = options.to_extraction_request(upload_data.file_id)
-
-        async with session.post(
-            f"{base_url}/extraction",
-            headers=headers,
-            json=extraction_request.model_dump(by_alias=True, exclude_none=True)
-        ) as extraction_response:
-            if extraction_response.status != 200:
-                error_text = await extraction_response.text()
-                raise VectorizeIrisError(
-                    f"Failed to start extraction: {extraction_response.status} - {error_text}"
-                )
-
-            extraction_data = StartExtractionResponse(**(await extraction_response.json()))
-
-        # Step 4: Poll for completion
-        start_time = asyncio.get_event_loop().time()
-
-        while True:
-            if asyncio.get_event_loop().time() - start_time > timeout:
-                raise VectorizeIrisError(f"Extraction timed out after {timeout} seconds")
-
-            async with session.get(
-                f"{base_url}/extraction/{extraction_data.extraction_id}",
-                headers=headers
-            ) as status_response:
-                if status_response.status != 200:
-                    error_text = await status_response.text()
+        if content_encoding is not None:
+            upload_headers["Content-Encoding"] = content_encoding
+
+        async def _put_file() -> None:
+            async with session.put(
+                upload_data.upload_url,
+                data=file_content,
+                headers=upload_headers,
+                timeout=_upload_timeout(file_size)
+            ) as put_response:
+                if put_response.status not in (200, 201, 204):
+                    error_text = await put_response.text()
                     raise VectorizeIrisError(
-                        f"Failed to check status: {status_response.status} - {error_text}"
+                        f"Failed to upload file: {put_response.status} - {error_text}"
                     )
 
-                result = ExtractionResult(**(await status_response.json()))
+        async def _start_extraction() -> tuple:
+            async with session.post(
+                f"{base_url}/extraction",
+                headers=headers,
+                data=json_dumps_bytes(options.to_request_body(upload_data.file_id)),
+                timeout=_REQUEST_TIMEOUT
+            ) as extraction_response:
+                if extraction_response.status != 200:
+                    error_text = await extraction_response.text()
+                    raise VectorizeIrisError(
+                        f"Failed to start extraction: {extraction_response.status} - {error_text}"
+                    )
 
-                if result.ready:
-                    if result.data is None:
-                        raise VectorizeIrisError("Extraction completed but no data was returned")
+                # Backends that support held status GETs advertise it here;
+                # the `or ''` keeps a missing/None header falsy.
+                long_poll = (
+                    extraction_response.headers.get('X-Supports-Long-Poll') or ''
+                ).lower() == 'true'
+                return (
+                    _EXTRACTION_RESPONSE_ADAPTER.validate_json(await extraction_response.read()),
+                    long_poll
+                )
 
-                    if not result.data.success:
-                        error_msg = result.data.error or "Unknown error"
-                        raise VectorizeIrisError(f"Extraction failed: {error_msg}")
+        put_result, extraction_result = await asyncio.gather(
+            _put_file(), _start_extraction(), return_exceptions=True
+        )
+        # Report the upload failure first: an extraction-start error is
+        # usually a consequence of the upload having gone wrong.
+        if isinstance(put_result, BaseException):
+            raise put_result
+        if isinstance(extraction_result, BaseException):
+            raise extraction_result
+        extraction_data, long_poll = extraction_result
+
+        # Step 4: Wait for completion
+        return await _await_ready(
+            session,
+            f"{base_url}/extraction/{extraction_data.extraction_id}",
+            headers,
+            poll_interval,
+            timeout,
+            poll_max_interval,
+            poll_backoff,
+            long_poll
+        )
 
-                    return result.data
+    # Reuse the session shared via vectorize_iris.session() when inside
+    # such a block; otherwise ride the process-wide singleton.
+    shared_session = _session_var.get()
+    if shared_session is not None:
+        return await _run(shared_session)
 
-            # Still processing, wait and retry
-            await asyncio.sleep(poll_interval)
+    return await _run(await _get_session())
 
 
 async def extract_text_async(
@@ -135,9 +345,12 @@ async def extract_text_async(
     file_name: str = "document.pdf",
     api_token: Optional[str] = None,
     org_id: Optional[str] = None,
-    poll_interval: int = 2,
+    poll_interval: float = 2,
     timeout: int = 300,
-    options: Optional[ExtractionOptions] = None
+    options: Optional[ExtractionOptions] = None,
+    poll_max_interval: float = 5.0,
+    poll_backoff: float = 1.5,
+    cache_dir: Optional[str] = None
 ) -> ExtractionResultData:
     """
     Extract text from file bytes using Vectorize Iris (asynchronous).
@@ -147,8 +360,14 @@ async def extract_text_async(
         file_name: Name of the file (default: "document.pdf")
         api_token: Vectorize access token (defaults to VECTORIZE_TOKEN env var)
         org_id: Organization ID (defaults to VECTORIZE_ORG_ID env var)
-        poll_interval: Seconds to wait between status checks (default: 2)
+        poll_interval: Initial seconds to wait between status checks (default: 2)
         timeout: Maximum seconds to wait for extraction (default: 300)
+        poll_max_interval: Cap on the backed-off poll delay (default: 5.0)
+        poll_backoff: Multiplier applied to the poll delay after each
+            check that is still processing (default: 1.5)
+        cache_dir: Directory for an on-disk result cache keyed by file
+            content and options; re-extracting identical input returns
+            the cached result without any network calls
         options: Extraction options (chunking, metadata, etc.)
 
     Returns:
@@ -157,9 +376,11 @@ async def extract_text_async(
     Raises:
         VectorizeIrisError: If extraction fails or times out
     """
-    # Get credentials from environment if not provided
-    api_token = api_token or os.getenv('VECTORIZE_TOKEN')
-    org_id = org_id or os.getenv('VECTORIZE_ORG_ID')
+    # Fill in credentials from the environment (read once per process)
+    if not api_token or not org_id:
+        env_token, env_org = default_creds()
+        api_token = api_token or env_token
+        org_id = org_id or env_org
 
     if not api_token or not org_id:
         raise VectorizeIrisError(
@@ -167,18 +388,32 @@ async def extract_text_async(
             "environment variables or pass them as parameters."
         )
 
-    return await _extract_from_bytes_async(
-        file_bytes, file_name, api_token, org_id, poll_interval, timeout, options
+    if cache_dir is not None:
+        key = _cache.cache_key(file_bytes, options)
+        cached = _cache.load(cache_dir, key)
+        if cached is not None:
+            return cached
+
+    result = await _extract_from_bytes_async(
+        file_bytes, file_name, api_token, org_id, poll_interval, timeout, options,
+        poll_max_interval=poll_max_interval, poll_backoff=poll_backoff
     )
 
+    if cache_dir is not None:
+        _cache.store(cache_dir, key, result)
+    return result
+
 
 async def extract_text_from_file_async(
     file_path: str,
     api_token: Optional[str] = None,
     org_id: Optional[str] = None,
-    poll_interval: int = 2,
+    poll_interval: float = 2,
     timeout: int = 300,
-    options: Optional[ExtractionOptions] = None
+    options: Optional[ExtractionOptions] = None,
+    poll_max_interval: float = 5.0,
+    poll_backoff: float = 1.5,
+    gzip_uploads: bool = False
 ) -> ExtractionResultData:
     """
     Extract text from a file using Vectorize Iris (asynchronous).
@@ -187,8 +422,14 @@ async def extract_text_from_file_async(
         file_path: Path to the file to extract text from
         api_token: Vectorize access token (defaults to VECTORIZE_TOKEN env var)
         org_id: Organization ID (defaults to VECTORIZE_ORG_ID env var)
-        poll_interval: Seconds to wait between status checks (default: 2)
+        poll_interval: Initial seconds to wait between status checks (default: 2)
         timeout: Maximum seconds to wait for extraction (default: 300)
+        poll_max_interval: Cap on the backed-off poll delay (default: 5.0)
+        poll_backoff: Multiplier applied to the poll delay after each
+            check that is still processing (default: 1.5)
+        gzip_uploads: Compress text-like files (.md, .txt, .html, ...)
+            with gzip before uploading; requires the upload endpoint to
+            accept Content-Encoding: gzip, so off by default
         options: Extraction options (chunking, metadata, etc.)
 
     Returns:
@@ -198,9 +439,11 @@ async def extract_text_from_file_async(
         VectorizeIrisError: If extraction fails or times out
         FileNotFoundError: If the file doesn't exist
     """
-    # Get credentials from environment if not provided
-    api_token = api_token or os.getenv('VECTORIZE_TOKEN')
-    org_id = org_id or os.getenv('VECTORIZE_ORG_ID')
+    # Fill in credentials from the environment (read once per process)
+    if not api_token or not org_id:
+        env_token, env_org = default_creds()
+        api_token = api_token or env_token
+        org_id = org_id or env_org
 
     if not api_token or not org_id:
         raise VectorizeIrisError(
@@ -208,16 +451,99 @@ async def extract_text_from_file_async(
             "environment variables or pass them as parameters."
         )
 
-    # Validate file exists and read content
+    # Validate file exists and stream its content instead of reading it
+    # all into memory; the upload then runs in bounded chunks. A single
+    # stat both checks existence and fetches the size (one syscall, not
+    # two — which matters on networked filesystems).
     file_path_obj = Path(file_path)
-    if not file_path_obj.exists():
+    try:
+        file_size = file_path_obj.stat().st_size
+    except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {file_path}")
+    file_name = file_path_obj.name
+
+    # Text-heavy formats compress well enough to shorten the upload leg
+    # several-fold; already-compressed formats (PDF, images) are skipped.
+    if gzip_uploads and file_path_obj.suffix.lower() in TEXT_SUFFIXES:
+        with open(file_path, 'rb') as f:
+            body_buf = gzip_payload(f)
+        return await _extract_from_bytes_async(
+            body_buf, file_name, api_token, org_id, poll_interval, timeout, options,
+            file_size=body_buf.getbuffer().nbytes,
+            poll_max_interval=poll_max_interval, poll_backoff=poll_backoff,
+            content_encoding="gzip"
+        )
 
     with open(file_path, 'rb') as f:
-        file_content = f.read()
+        return await _extract_from_bytes_async(
+            f, file_name, api_token, org_id, poll_interval, timeout, options,
+            file_size=file_size,
+            poll_max_interval=poll_max_interval, poll_backoff=poll_backoff
+        )
 
-    file_name = file_path_obj.name
 
-    return await _extract_from_bytes_async(
-        file_content, file_name, api_token, org_id, poll_interval, timeout, options
+async def extract_text_many_async(
+    files: Sequence[Tuple[bytes, str]],
+    max_concurrency: int = 10,
+    api_token: Optional[str] = None,
+    org_id: Optional[str] = None,
+    poll_interval: float = 2,
+    timeout: int = 300,
+    options: Optional[ExtractionOptions] = None,
+    poll_max_interval: float = 5.0,
+    poll_backoff: float = 1.5
+) -> List[Union[ExtractionResultData, Exception]]:
+    """
+    Extract text from many in-memory files concurrently.
+
+    Up to max_concurrency extractions run at once over the shared
+    session, so uploads and status waits overlap across files instead
+    of running one after another. One failing file does not cancel the
+    rest: its slot in the result list holds the exception.
+
+    Args:
+        files: (file_bytes, file_name) pairs to extract
+        max_concurrency: Maximum number of extractions in flight (default: 10)
+        api_token: Vectorize access token (defaults to VECTORIZE_TOKEN env var)
+        org_id: Organization ID (defaults to VECTORIZE_ORG_ID env var)
+        poll_interval: Initial seconds to wait between status checks (default: 2)
+        timeout: Maximum seconds to wait for each extraction (default: 300)
+        poll_max_interval: Cap on the backed-off poll delay (default: 5.0)
+        poll_backoff: Multiplier applied to the poll delay after each
+            check that is still processing (default: 1.5)
+        options: Extraction options applied to every file
+
+    Returns:
+        One ExtractionResultData or Exception per input pair, in order
+
+    Example:
+        >>> results = await extract_text_many_async(
+        ...     [(a_bytes, "a.pdf"), (b_bytes, "b.pdf")], max_concurrency=4
+        ... )
+    """
+    # Fill in credentials from the environment (read once per process)
+    if not api_token or not org_id:
+        env_token, env_org = default_creds()
+        api_token = api_token or env_token
+        org_id = org_id or env_org
+
+    if not api_token or not org_id:
+        raise VectorizeIrisError(
+            "Missing credentials. Set VECTORIZE_TOKEN and VECTORIZE_ORG_ID "
+            "environment variables or pass them as parameters."
+        )
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _one(file_bytes: bytes, file_name: str) -> ExtractionResultData:
+        async with semaphore:
+            return await _extract_from_bytes_async(
+                file_bytes, file_name, api_token, org_id,
+                poll_interval, timeout, options,
+                poll_max_interval=poll_max_interval, poll_backoff=poll_backoff
+            )
+
+    return await asyncio.gather(
+        *[_one(file_bytes, file_name) for file_bytes, file_name in files],
+        return_exceptions=True
     )
@@ -0,0 +1,75 @@
+"""
+Process-based batch extraction for Vectorize Iris
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+from vectorize_iris.models import ExtractionOptions, ExtractionResultData
+
+
+def _worker_extract(
+    path: str,
+    options: Optional[ExtractionOptions],
+    api_token: Optional[str],
+    org_id: Optional[str]
+) -> ExtractionResultData:
+    """Top-level (picklable) worker running one extraction in a subprocess"""
+    from vectorize_iris.client import extract_text_from_file
+
+    return extract_text_from_file(
+        path, api_token=api_token, org_id=org_id, options=options
+    )
+
+
+def extract_text_parallel(
+    paths: Iterable[str],
+    options: Optional[ExtractionOptions] = None,
+    workers: Optional[int] = None,
+    api_token: Optional[str] = None,
+    org_id: Optional[str] = None
+) -> Iterator[Tuple[str, Union[ExtractionResultData, Exception]]]:
+    """
+    Extract text from many files across a pool of worker processes.
+
+    Unlike extract_text_batch, which overlaps network waits on one event
+    loop, this shards the files across processes so the per-file CPU
+    work (JSON parsing, Pydantic validation) also scales with cores.
+    Worth it for very large batches; for ordinary batches the async
+    variant is cheaper to spin up.
+
+    Args:
+        paths: Paths of the files to extract text from
+        options: Extraction options applied to every file (must be
+            picklable, which Pydantic models are)
+        workers: Number of worker processes (default: os.cpu_count())
+        api_token: Vectorize access token (defaults to VECTORIZE_TOKEN env var)
+        org_id: Organization ID (defaults to VECTORIZE_ORG_ID env var)
+
+    Yields:
+        (path, result) pairs as extractions finish, where result is the
+        ExtractionResultData or the exception that file raised
+
+    Example:
+        >>> from vectorize_iris.batch import extract_text_parallel
+        >>> for path, result in extract_text_parallel(paths, workers=4):
+        ...     if isinstance(result, Exception):
+        ...         print(f"{path} failed: {result}")
+        ...     else:
+        ...         print(f"{path}: {len(result.text)} characters")
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_worker_extract, path, options, api_token, org_id): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                yield path, future.result()
+            except Exception as exc:
+                yield path, exc
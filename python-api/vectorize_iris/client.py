@@ -2,58 +2,118 @@
 Synchronous client for Vectorize Iris text extraction
 """
 
-import os
+import asyncio
+import mmap
 import time
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import BinaryIO, Callable, Iterable, List, Optional, Union
 from pathlib import Path
-
+from urllib3.util.retry import Retry
+
+from vectorize_iris import _cache
+from vectorize_iris._utils import (
+    LONG_POLL_MIN_HOLD,
+    TEXT_SUFFIXES,
+    build_headers,
+    default_creds,
+    gzip_payload,
+    json_dumps_bytes,
+    json_loads,
+    next_delay,
+)
 from vectorize_iris.exceptions import VectorizeIrisError
 from vectorize_iris.models import (
+    _EXTRACTION_RESPONSE_ADAPTER,
+    _RESULT_DATA_ADAPTER,
+    _UPLOAD_RESPONSE_ADAPTER,
     StartFileUploadRequest,
-    StartFileUploadResponse,
-    StartExtractionRequest,
-    StartExtractionResponse,
-    ExtractionResult,
     ExtractionResultData,
     ExtractionOptions,
 )
 
 
+_session: Optional[requests.Session] = None
+
+# Upload bodies at least this large are memory-mapped instead of read
+# through the file handle, letting the kernel page them in on demand and
+# reclaim the pages under memory pressure.
+_MMAP_THRESHOLD = 8 * 1024 * 1024
+
+
+def _get_session() -> requests.Session:
+    """
+    Return the shared keep-alive session, creating it on first use.
+
+    A single pooled session lets the upload-start, presigned PUT,
+    extraction-start, and every poll GET reuse warm TCP/TLS connections
+    instead of handshaking per request. Only GETs are retried
+    automatically: the POSTs are not idempotent and the PUT body may be
+    a stream that cannot be rewound.
+    """
+    global _session
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset({"GET"})
+            )
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
+
+
 def _extract_from_bytes(
-    file_content: bytes,
+    file_content: Union[bytes, BinaryIO],
     file_name: str,
     api_token: str,
     org_id: str,
-    poll_interval: int,
+    poll_interval: float,
     timeout: int,
-    options: Optional[ExtractionOptions] = None
+    options: Optional[ExtractionOptions] = None,
+    file_size: Optional[int] = None,
+    poll_max_interval: float = 5.0,
+    poll_backoff: float = 1.5,
+    content_encoding: Optional[str] = None
 ) -> ExtractionResultData:
     """
-    Internal function to extract from file bytes.
+    Internal function to extract from file bytes or a readable binary stream.
+
+    When a stream is passed, file_size must be provided; the HTTP layer
+    then uploads it in bounded chunks instead of buffering the whole body.
     """
     base_url = f"https://api.vectorize.io/v1/org/{org_id}"
-    headers = {
-        "Authorization": f"Bearer {api_token}",
-        "Content-Type": "application/json"
-    }
+    headers = build_headers(api_token)
 
-    file_size = len(file_content)
+    if file_size is None:
+        file_size = len(file_content)
 
     # Default options if not provided
     if options is None:
         options = ExtractionOptions()
 
+    session = _get_session()
+
     # Step 1: Start file upload and get presigned URL
     upload_request = StartFileUploadRequest(
         name=file_name,
         content_type="application/octet-stream"
     )
 
-    upload_response = requests.post(
+    # The headers already declare application/json, so encode the body
+    # directly (orjson when available) instead of the json= kwarg's
+    # stdlib serializer.
+    upload_response = session.post(
         f"{base_url}/files",
         headers=headers,
-        json=upload_request.model_dump(by_alias=True)
+        data=json_dumps_bytes(upload_request.model_dump(by_alias=True))
     )
 
     if upload_response.status_code != 200:
@@ -61,15 +121,17 @@ def _extract_from_bytes(
             f"Failed to start upload: {upload_response.status_code} - {upload_response.text}"
         )
 
-    upload_data = StartFileUploadResponse(**upload_response.json())
+    upload_data = _UPLOAD_RESPONSE_ADAPTER.validate_json(upload_response.content)
 
     # Step 2: Upload file to presigned URL
     upload_headers = {
         "Content-Type": "application/octet-stream",
         "Content-Length": str(file_size)
     }
+    if content_encoding is not None:
+        upload_headers["Content-Encoding"] = content_encoding
 
-    put_response = requests.put(upload_data.upload_url, data=file_content, headers=upload_headers)
+    put_response = session.put(upload_data.upload_url, data=file_content, headers=upload_headers)
 
     if put_response.status_code not in (200, 201, 204):
         raise VectorizeIrisError(
@@ -77,12 +139,10 @@ def _extract_from_bytes(
         )
 
     # Step 3: Start extraction
-    extraction_request = options.to_extraction_request(upload_data.file_id)
-
-    extraction_response = requests.post(
+    extraction_response = session.post(
         f"{base_url}/extraction",
         headers=headers,
-        json=extraction_request.model_dump(by_alias=True, exclude_none=True)
+        data=json_dumps_bytes(options.to_request_body(upload_data.file_id))
     )
 
     if extraction_response.status_code != 200:
@@ -90,39 +150,60 @@ def _extract_from_bytes(
             f"Failed to start extraction: {extraction_response.status_code} - {extraction_response.text}"
         )
 
-    extraction_data = StartExtractionResponse(**extraction_response.json())
-
-    # Step 4: Poll for completion
+    extraction_data = _EXTRACTION_RESPONSE_ADAPTER.validate_json(extraction_response.content)
+
+    # Step 4: Poll for completion. Backends that support held status GETs
+    # advertise it on the extraction-start response; with long polling
+    # each GET returns only when the status changes, so no client-side
+    # backoff is needed. Otherwise poll with exponential backoff: fast
+    # jobs are noticed within the initial interval while long jobs poll
+    # less and less often, up to poll_max_interval. The jitter keeps
+    # concurrent extractions from polling in lockstep.
+    long_poll = (
+        extraction_response.headers.get('X-Supports-Long-Poll') or ''
+    ).lower() == 'true'
+    status_url = f"{base_url}/extraction/{extraction_data.extraction_id}"
+    status_params = {'wait': '30'} if long_poll else None
     start_time = time.time()
+    attempt = 0
 
     while True:
         if time.time() - start_time > timeout:
             raise VectorizeIrisError(f"Extraction timed out after {timeout} seconds")
 
-        status_response = requests.get(
-            f"{base_url}/extraction/{extraction_data.extraction_id}",
-            headers=headers
-        )
+        request_started = time.time()
+        status_response = session.get(status_url, headers=headers, params=status_params)
 
         if status_response.status_code != 200:
             raise VectorizeIrisError(
                 f"Failed to check status: {status_response.status_code} - {status_response.text}"
             )
 
-        result = ExtractionResult(**status_response.json())
+        # Check readiness on the raw payload; the full result model is
+        # only validated once, on the poll that actually carries data.
+        payload = json_loads(status_response.content)
 
-        if result.ready:
-            if result.data is None:
+        if payload.get('ready'):
+            if payload.get('data') is None:
                 raise VectorizeIrisError("Extraction completed but no data was returned")
 
-            if not result.data.success:
-                error_msg = result.data.error or "Unknown error"
+            result_data = _RESULT_DATA_ADAPTER.validate_python(payload['data'])
+
+            if not result_data.success:
+                error_msg = result_data.error or "Unknown error"
                 raise VectorizeIrisError(f"Extraction failed: {error_msg}")
 
-            return result.data
+            return result_data
 
-        # Still processing, wait and retry
-        time.sleep(poll_interval)
+        # Still processing; with long polling the server already held the
+        # request, so re-issue immediately — but only if it actually held
+        # it. An instant not-ready answer (wait= stripped by a proxy,
+        # load shedding) would otherwise busy-loop at full RTT, so fast
+        # responses fall through to the backoff path.
+        if long_poll and time.time() - request_started >= LONG_POLL_MIN_HOLD:
+            continue
+        attempt += 1
+        time.sleep(next_delay(attempt, poll_interval, poll_max_interval, poll_backoff))
 
 
 def extract_text(
@@ -130,9 +211,12 @@ def extract_text(
     file_name: str = "document.pdf",
     api_token: Optional[str] = None,
     org_id: Optional[str] = None,
-    poll_interval: int = 2,
+    poll_interval: float = 2,
     timeout: int = 300,
-    options: Optional[ExtractionOptions] = None
+    options: Optional[ExtractionOptions] = None,
+    poll_max_interval: float = 5.0,
+    poll_backoff: float = 1.5,
+    cache_dir: Optional[str] = None
 ) -> ExtractionResultData:
     """
     Extract text from file bytes using Vectorize Iris (synchronous).
@@ -142,8 +226,14 @@ def extract_text(
         file_name: Name of the file (default: "document.pdf")
         api_token: Vectorize access token (defaults to VECTORIZE_TOKEN env var)
         org_id: Organization ID (defaults to VECTORIZE_ORG_ID env var)
-        poll_interval: Seconds to wait between status checks (default: 2)
+        poll_interval: Initial seconds to wait between status checks (default: 2)
         timeout: Maximum seconds to wait for extraction (default: 300)
+        poll_max_interval: Cap on the backed-off poll delay (default: 5.0)
+        poll_backoff: Multiplier applied to the poll delay after each
+            check that is still processing (default: 1.5)
+        cache_dir: Directory for an on-disk result cache keyed by file
+            content and options; re-extracting identical input returns
+            the cached result without any network calls
         options: Extraction options (chunking, metadata, etc.)
 
     Returns:
@@ -159,9 +249,11 @@ def extract_text(
         >>> print(result.text)
         >>> print(result.chunks)  # If chunking was requested
     """
-    # Get credentials from environment if not provided
-    api_token = api_token or os.getenv('VECTORIZE_TOKEN')
-    org_id = org_id or os.getenv('VECTORIZE_ORG_ID')
+    # Fill in credentials from the environment (read once per process)
+    if not api_token or not org_id:
+        env_token, env_org = default_creds()
+        api_token = api_token or env_token
+        org_id = org_id or env_org
 
     if not api_token or not org_id:
         raise VectorizeIrisError(
@@ -169,18 +261,32 @@ def extract_text(
             "environment variables or pass them as parameters."
         )
 
-    return _extract_from_bytes(
-        file_bytes, file_name, api_token, org_id, poll_interval, timeout, options
+    if cache_dir is not None:
+        key = _cache.cache_key(file_bytes, options)
+        cached = _cache.load(cache_dir, key)
+        if cached is not None:
+            return cached
+
+    result = _extract_from_bytes(
+        file_bytes, file_name, api_token, org_id, poll_interval, timeout, options,
+        poll_max_interval=poll_max_interval, poll_backoff=poll_backoff
     )
 
+    if cache_dir is not None:
+        _cache.store(cache_dir, key, result)
+    return result
+
 
 def extract_text_from_file(
     file_path: str,
     api_token: Optional[str] = None,
     org_id: Optional[str] = None,
-    poll_interval: int = 2,
+    poll_interval: float = 2,
     timeout: int = 300,
-    options: Optional[ExtractionOptions] = None
+    options: Optional[ExtractionOptions] = None,
+    poll_max_interval: float = 5.0,
+    poll_backoff: float = 1.5,
+    gzip_uploads: bool = False
 ) -> ExtractionResultData:
     """
     Extract text from a file using Vectorize Iris (synchronous).
@@ -189,8 +295,14 @@ def extract_text_from_file(
         file_path: Path to the file to extract text from
         api_token: Vectorize access token (defaults to VECTORIZE_TOKEN env var)
         org_id: Organization ID (defaults to VECTORIZE_ORG_ID env var)
-        poll_interval: Seconds to wait between status checks (default: 2)
+        poll_interval: Initial seconds to wait between status checks (default: 2)
         timeout: Maximum seconds to wait for extraction (default: 300)
+        poll_max_interval: Cap on the backed-off poll delay (default: 5.0)
+        poll_backoff: Multiplier applied to the poll delay after each
+            check that is still processing (default: 1.5)
+        gzip_uploads: Compress text-like files (.md, .txt, .html, ...)
+            with gzip before uploading; requires the upload endpoint to
+            accept Content-Encoding: gzip, so off by default
         options: Extraction options (chunking, metadata, etc.)
 
     Returns:
@@ -228,9 +340,11 @@ def extract_text_from_file(
         >>> result = extract_text_from_file("document.pdf", options=options)
         >>> print(result.metadata)  # JSON string
     """
-    # Get credentials from environment if not provided
-    api_token = api_token or os.getenv('VECTORIZE_TOKEN')
-    org_id = org_id or os.getenv('VECTORIZE_ORG_ID')
+    # Fill in credentials from the environment (read once per process)
+    if not api_token or not org_id:
+        env_token, env_org = default_creds()
+        api_token = api_token or env_token
+        org_id = org_id or env_org
 
     if not api_token or not org_id:
         raise VectorizeIrisError(
@@ -238,16 +352,124 @@ def extract_text_from_file(
             "environment variables or pass them as parameters."
         )
 
-    # Validate file exists and read content
+    # Validate file exists and stream its content instead of reading it
+    # all into memory; the upload then runs in bounded chunks. A single
+    # stat both checks existence and fetches the size (one syscall, not
+    # two — which matters on networked filesystems).
     file_path_obj = Path(file_path)
-    if not file_path_obj.exists():
+    try:
+        file_size = file_path_obj.stat().st_size
+    except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {file_path}")
+    file_name = file_path_obj.name
+
+    # Text-heavy formats compress well enough to shorten the upload leg
+    # several-fold; already-compressed formats (PDF, images) are skipped.
+    if gzip_uploads and file_path_obj.suffix.lower() in TEXT_SUFFIXES:
+        with open(file_path, 'rb') as f:
+            body_buf = gzip_payload(f)
+        return _extract_from_bytes(
+            body_buf, file_name, api_token, org_id, poll_interval, timeout, options,
+            file_size=body_buf.getbuffer().nbytes,
+            poll_max_interval=poll_max_interval, poll_backoff=poll_backoff,
+            content_encoding="gzip"
+        )
 
     with open(file_path, 'rb') as f:
-        file_content = f.read()
+        body: Union[BinaryIO, mmap.mmap] = f
+        mm = None
+        if file_size >= _MMAP_THRESHOLD:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                body = mm
+            except (ValueError, OSError):
+                # Fall back to streaming the plain file handle
+                mm = None
+        try:
+            return _extract_from_bytes(
+                body, file_name, api_token, org_id, poll_interval, timeout, options,
+                file_size=file_size,
+                poll_max_interval=poll_max_interval, poll_backoff=poll_backoff
+            )
+        finally:
+            if mm is not None:
+                mm.close()
 
-    file_name = file_path_obj.name
 
-    return _extract_from_bytes(
-        file_content, file_name, api_token, org_id, poll_interval, timeout, options
-    )
+def extract_text_batch(
+    paths: Iterable[str],
+    options: Optional[ExtractionOptions] = None,
+    concurrency: int = 8,
+    on_progress: Optional[Callable[[int, int, Union[ExtractionResultData, Exception]], None]] = None,
+    api_token: Optional[str] = None,
+    org_id: Optional[str] = None,
+    poll_interval: float = 2,
+    timeout: int = 300
+) -> List[Union[ExtractionResultData, Exception]]:
+    """
+    Extract text from many files concurrently using Vectorize Iris.
+
+    Runs up to `concurrency` extractions at a time on an internal event
+    loop, so uploads and status polls for the whole batch overlap instead
+    of running file by file. One failing file does not stop the batch:
+    its slot in the result list holds the exception instead.
+
+    Args:
+        paths: Paths of the files to extract text from
+        options: Extraction options applied to every file
+        concurrency: Maximum number of extractions in flight (default: 8)
+        on_progress: Optional callback fired as each file finishes,
+            called with (done, total, result_or_exception)
+        api_token: Vectorize access token (defaults to VECTORIZE_TOKEN env var)
+        org_id: Organization ID (defaults to VECTORIZE_ORG_ID env var)
+        poll_interval: Initial seconds to wait between status checks (default: 2)
+        timeout: Maximum seconds to wait for each extraction (default: 300)
+
+    Returns:
+        One ExtractionResultData or Exception per path, in input order
+
+    Example:
+        >>> results = extract_text_batch(["a.pdf", "b.pdf"], concurrency=4)
+        >>> for path, result in zip(["a.pdf", "b.pdf"], results):
+        ...     if isinstance(result, Exception):
+        ...         print(f"{path} failed: {result}")
+        ...     else:
+        ...         print(f"{path}: {len(result.text)} characters")
+    """
+    from vectorize_iris.async_client import aclose, extract_text_from_file_async
+
+    path_list = list(paths)
+    total = len(path_list)
+
+    async def _run() -> List[Union[ExtractionResultData, Exception]]:
+        semaphore = asyncio.Semaphore(concurrency)
+        done = 0
+
+        async def _one(path: str) -> Union[ExtractionResultData, Exception]:
+            nonlocal done
+            async with semaphore:
+                try:
+                    result = await extract_text_from_file_async(
+                        path,
+                        api_token=api_token,
+                        org_id=org_id,
+                        poll_interval=poll_interval,
+                        timeout=timeout,
+                        options=options
+                    )
+                except Exception as exc:
+                    result = exc
+            done += 1
+            if on_progress is not None:
+                on_progress(done, total, result)
+            return result
+
+        try:
+            return await asyncio.gather(*[_one(p) for p in path_list])
+        finally:
+            # The shared session these extractions may have created is
+            # bound to this loop, which dies when asyncio.run returns;
+            # close it here rather than leaving a dead session behind.
+            await aclose()
+
+    return asyncio.run(_run())
@@ -2,16 +2,50 @@
 Pydantic models for Vectorize Iris API
 """
 
-from typing import Optional, List, Literal, Union, Dict, Any
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from typing import Optional, List, Literal, Union, Dict, Any, Mapping
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_validator
+import functools
 import json
 
+from vectorize_iris._utils import json_dumps
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively convert dicts/lists into hashable tuples for caching."""
+    if isinstance(obj, Mapping):
+        return tuple((k, _freeze(v)) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return ('__seq__', tuple(_freeze(v) for v in obj))
+    return obj
+
+
+def _unfreeze(obj: Any) -> Any:
+    """Invert _freeze back into plain dicts/lists."""
+    if isinstance(obj, tuple):
+        if len(obj) == 2 and obj[0] == '__seq__':
+            return [_unfreeze(v) for v in obj[1]]
+        return {k: _unfreeze(v) for k, v in obj}
+    return obj
+
+
+@functools.lru_cache(maxsize=256)
+def _dumps_frozen(frozen: Any) -> str:
+    """Serialize a frozen schema dict, caching repeated schemas."""
+    return json_dumps(_unfreeze(frozen))
+
+
+# One shared config per model family: Pydantic builds the core schema
+# per class either way, but the shared constants keep the request /
+# response conventions (responses tolerate unknown fields) in one place.
+_REQUEST_CONFIG = ConfigDict(populate_by_name=True)
+_RESPONSE_CONFIG = ConfigDict(populate_by_name=True, extra='allow')
+
 
 # Request Models
 
 class StartFileUploadRequest(BaseModel):
     """Request to start file upload"""
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = _REQUEST_CONFIG
 
     name: str = Field(..., description="File name")
     content_type: str = Field(..., alias="contentType", description="Content type of the file")
@@ -19,7 +53,7 @@ class StartFileUploadRequest(BaseModel):
 
 class MetadataExtractionStrategySchema(BaseModel):
     """Schema for metadata extraction"""
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = _REQUEST_CONFIG
 
     id: str = Field(..., description="Schema identifier")
     schema_: str = Field(..., alias="schema", description="Schema definition for metadata extraction (JSON string or dict)")
@@ -28,14 +62,26 @@ class MetadataExtractionStrategySchema(BaseModel):
     @classmethod
     def convert_schema_to_string(cls, v: Union[str, Dict[str, Any]]) -> str:
         """Convert dict schema to JSON string if needed"""
-        if isinstance(v, dict):
-            return json.dumps(v)
+        if isinstance(v, Mapping):
+            # Batch callers tend to reuse the same schema dict for every
+            # document, so serialize through an LRU cache keyed on a
+            # hashable form of the dict instead of re-dumping each time.
+            try:
+                return _dumps_frozen(_freeze(v))
+            except TypeError:
+                # Unhashable value somewhere in the schema; serialize directly.
+                return json.dumps(v, default=dict)
         return v
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Clear the cached schema serializations (mainly for tests)."""
+        _dumps_frozen.cache_clear()
+
 
 class MetadataExtractionStrategy(BaseModel):
     """Strategy for extracting metadata"""
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = _REQUEST_CONFIG
 
     schemas: Optional[List[MetadataExtractionStrategySchema]] = Field(default=None, description="List of metadata schemas")
     infer_schema: Optional[bool] = Field(default=None, alias="inferSchema", description="Whether to infer metadata schema automatically")
@@ -43,7 +89,7 @@ class MetadataExtractionStrategy(BaseModel):
 
 class StartExtractionRequest(BaseModel):
     """Request to start content extraction"""
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = _REQUEST_CONFIG
 
     file_id: str = Field(..., alias="fileId", description="ID of the uploaded file")
     type: Optional[Literal["iris"]] = Field(default="iris", description="Extraction type")
@@ -60,7 +106,7 @@ class StartExtractionRequest(BaseModel):
 
 class StartFileUploadResponse(BaseModel):
     """Response from starting file upload"""
-    model_config = ConfigDict(populate_by_name=True, extra='allow')
+    model_config = _RESPONSE_CONFIG
 
     file_id: str = Field(..., alias="fileId", description="Unique identifier for the uploaded file")
     upload_url: str = Field(..., alias="uploadUrl", description="Presigned URL for uploading the file")
@@ -68,7 +114,7 @@ class StartFileUploadResponse(BaseModel):
 
 class StartExtractionResponse(BaseModel):
     """Response from starting extraction"""
-    model_config = ConfigDict(populate_by_name=True, extra='allow')
+    model_config = _RESPONSE_CONFIG
 
     message: str = Field(..., description="Status message")
     extraction_id: str = Field(..., alias="extractionId", description="Unique identifier for the extraction job")
@@ -76,14 +122,14 @@ class StartExtractionResponse(BaseModel):
 
 class UsageInfo(BaseModel):
     """Usage information for the extraction"""
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = _REQUEST_CONFIG
 
     iris_pages: int = Field(..., alias="irisPages", description="Number of pages processed by Iris")
 
 
 class ExtractionResultData(BaseModel):
     """Data contained in extraction result"""
-    model_config = ConfigDict(populate_by_name=True, extra='allow')
+    model_config = _RESPONSE_CONFIG
 
     success: bool = Field(..., description="Whether the extraction was successful")
     chunks: Optional[List[str]] = Field(default=None, description="Extracted chunks of text")
@@ -106,7 +152,7 @@ class ExtractionResultData(BaseModel):
 
 class ExtractionResult(BaseModel):
     """Result of an extraction job"""
-    model_config = ConfigDict(populate_by_name=True, extra='allow')
+    model_config = _RESPONSE_CONFIG
 
     ready: bool = Field(..., description="Whether the extraction is complete")
     data: Optional[ExtractionResultData] = Field(default=None, description="Extraction data (when ready=True)")
@@ -129,13 +175,14 @@ class ExtractionOptions(BaseModel):
         """Convert dict schemas to MetadataExtractionStrategySchema objects"""
         if v is None:
             return None
-        result = []
-        for item in v:
-            if isinstance(item, dict):
-                result.append(MetadataExtractionStrategySchema(**item))
-            else:
-                result.append(item)
-        return result
+        # Fast path: callers passing already-built schema objects (the
+        # common case for reused options) keep their list untouched.
+        if all(isinstance(item, MetadataExtractionStrategySchema) for item in v):
+            return v
+        return [
+            MetadataExtractionStrategySchema(**item) if isinstance(item, Mapping) else item
+            for item in v
+        ]
     infer_metadata_schema: Optional[bool] = Field(
         default=True,
         description="Whether to automatically infer metadata schema (default: True)"
@@ -145,19 +192,57 @@ class ExtractionOptions(BaseModel):
         description="Optional instructions for parsing the document"
     )
 
+    @functools.cached_property
+    def _cached_metadata(self) -> Optional[MetadataExtractionStrategy]:
+        """Metadata strategy built once and reused across requests"""
+        if self.metadata_schemas is None and self.infer_metadata_schema is None:
+            return None
+        return MetadataExtractionStrategy(
+            schemas=self.metadata_schemas,
+            infer_schema=self.infer_metadata_schema
+        )
+
     def to_extraction_request(self, file_id: str) -> StartExtractionRequest:
-        """Convert options to StartExtractionRequest"""
-        metadata = None
-        if self.metadata_schemas is not None or self.infer_metadata_schema is not None:
-            metadata = MetadataExtractionStrategy(
-                schemas=self.metadata_schemas,
-                infer_schema=self.infer_metadata_schema
-            )
-
-        return StartExtractionRequest(
+        """
+        Convert options to StartExtractionRequest.
+
+        Everything except file_id is fixed per options instance, so the
+        metadata strategy is cached and the request is assembled with
+        model_construct, skipping re-validation of fields that were
+        already validated when the options were built. Options reused
+        across a batch (the common case) pay the validation cost once;
+        mutating the instance after the first request is not supported.
+        """
+        return StartExtractionRequest.model_construct(
             file_id=file_id,
             type=self.type,
             chunk_size=self.chunk_size,
-            metadata=metadata,
+            metadata=self._cached_metadata,
             parsing_instructions=self.parsing_instructions
         )
+
+    @functools.cached_property
+    def _serialized_template(self) -> Dict[str, Any]:
+        """Extraction request body dumped once per options instance.
+
+        Everything except fileId is fixed, so the alias/exclude-none walk
+        over the model graph runs a single time; per-file bodies are then
+        a dict merge away.
+        """
+        template = self.to_extraction_request("__PLACEHOLDER__").model_dump(
+            by_alias=True, exclude_none=True
+        )
+        template.pop('fileId', None)
+        return template
+
+    def to_request_body(self, file_id: str) -> Dict[str, Any]:
+        """Build the extraction request body for one file"""
+        return {**self._serialized_template, 'fileId': file_id}
+
+
+# Prebuilt adapters for the clients' hot response parsing. validate_json
+# fuses JSON decode and validation into one core-schema pass, skipping
+# the **kwargs unpacking of the model constructors.
+_UPLOAD_RESPONSE_ADAPTER = TypeAdapter(StartFileUploadResponse)
+_EXTRACTION_RESPONSE_ADAPTER = TypeAdapter(StartExtractionResponse)
+_RESULT_DATA_ADAPTER = TypeAdapter(ExtractionResultData)